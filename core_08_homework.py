@@ -1,11 +1,46 @@
-import pickle
-from datetime import datetime, timedelta
-from collections import UserDict
+import copy
+import sys
+from datetime import date, timedelta
+from bisect import bisect_left, insort
 from typing import Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from random import choice
 from colorama import Fore
 
+# Colour prefixes and static messages for bot responses
+GREEN_NL = Fore.GREEN + "\n"
+RED_NL = Fore.RED + "\n"
+WHITE_NL = Fore.WHITE + "\n"
+WELCOME = Fore.GREEN + "Welcome to the assistant bot!".upper()
+PROMPT = Fore.YELLOW + "\nEnter a command: " + Fore.WHITE
+COLOURS = (Fore.RED, Fore.GREEN, Fore.YELLOW, Fore.BLUE, Fore.MAGENTA, Fore.CYAN, Fore.WHITE)
+BOT_BANNER = """\
+ ██▓███   ██░ ██  ▒█████   ███▄    █ ▓█████     ▄▄▄▄    ▒█████  ▄▄▄█████▓
+▓██░  ██▒▓██░ ██▒▒██▒  ██▒ ██ ▀█   █ ▓█   ▀    ▓█████▄ ▒██▒  ██▒▓  ██▒ ▓▒
+▓██░ ██▓▒▒██▀▀██░▒██░  ██▒▓██  ▀█ ██▒▒███      ▒██▒ ▄██▒██░  ██▒▒ ▓██░ ▒░
+▒██▄█▓▒ ▒░▓█ ░██ ▒██   ██░▓██▒  ▐▌██▒▒▓█  ▄    ▒██░ █▀  ▒██   ██░░ ▓██▓ ░ 
+▒██▒ ░  ░░▓█▒░██▓░ ████▓▒░▒██░   ▓██░░▒████▒   ░▓█  ▀█▓░ ████▓▒░  ▒██▒ ░ 
+▒▓▒░ ░  ░ ▒ ░░▒░▒░ ▒░▒░▒░ ░ ▒░   ▒ ▒ ░░ ▒░ ░   ░▒▓███▀▒░ ▒░▒░▒░   ▒ ░░   
+░▒ ░      ▒ ░▒░ ░  ░ ▒ ▒░ ░ ░░   ░ ▒░ ░ ░  ░   ▒░▒   ░   ░ ▒ ▒░     ░    
+░░        ░  ░░ ░░ ░ ░ ▒     ░   ░ ░    ░       ░    ░ ░ ░ ░ ▒    ░      
+          ░  ░  ░    ░ ░           ░    ░  ░    ░          ░ ░           
+                                                     ░                   """
+COMMAND_LIST = f"""
+    {Fore.BLUE + "List of available commands".upper()}:
+
+    {Fore.WHITE}hello {Fore.BLUE}- say hello to the bot
+    {Fore.WHITE}help {Fore.BLUE}- show list of commands
+    {Fore.WHITE}add <username> <phone> {Fore.BLUE}- add a new contact with phone number
+    {Fore.WHITE}change <username> <old phone> <new phone>{Fore.BLUE}- change phone number
+    {Fore.WHITE}phone <username> {Fore.BLUE}- show phone number
+    {Fore.WHITE}add-birthday <username> <birthday (dd.mm.YYYY)>{Fore.BLUE}- add/change birthday
+    {Fore.WHITE}show-birthday <username> {Fore.BLUE}- show birthday
+    {Fore.WHITE}birthdays {Fore.BLUE}- show all congratulation dates within the next 7 days
+    {Fore.WHITE}all {Fore.BLUE}- show all contacts
+    {Fore.WHITE}exit {Fore.BLUE}- exit the bot
+    {Fore.WHITE}close {Fore.BLUE}- exit the bot
+    """
+
 class PhoneValidationError(Exception):
     pass
 
@@ -16,121 +51,302 @@ class DateValidationError(Exception):
     pass
 
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
         self.value = value
 
     def __str__(self):
         return str(self.value)
 
+    # Restore fields pickled with an instance __dict__ (before __slots__)
+    def __setstate__(self, state: dict | tuple):
+        if isinstance(state, tuple):
+            state = state[1]
+        self.__init__(state["value"])
+
 class Name(Field):
-    pass
+    __slots__ = ()
 
 class Birthday(Field):
+    __slots__ = ("date",)
+
     def __init__(self, value: str):
+        # Parse DD.MM.YYYY by hand, strptime is much slower
         try:
-            if datetime.strptime(value, "%d.%m.%Y"):
-                super().__init__(value)
+            day, month, year = value.split(".")
+            if not (day.isdigit() and month.isdigit() and year.isdigit()) \
+                    or len(day) > 2 or len(month) > 2 or len(year) != 4:
+                raise ValueError(value)
+            self.date = date(int(year), int(month), int(day))
         except ValueError as exc:
             raise DateValidationError("Invalid date (try using DD.MM.YYYY format)") from exc
+        super().__init__(value)
         
+# Function to validate a phone number
+def _validate_phone(value: str) -> str:
+    if len(value) != 10:
+        raise PhoneValidationError("Phone number must be 10 digits long")
+    if not value.isdigit():
+        raise PhoneValidationError("Phone number must contain digits only")
+    return value
+
+# Records keep phone numbers as strings, Phone also lets old pickles load
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
-        if len(value) != 10:
-            raise PhoneValidationError("Phone number must be 10 digits long")
-        if not value.isdigit():
-            raise PhoneValidationError("Phone number must contain digits only")
-        super().__init__(value)
+        super().__init__(_validate_phone(value))
 
 class Record:
+    __slots__ = ("name", "phones", "_birthday", "_cached_str", "_book", "_key")
+
     def __init__(self, name: str):
+        # Address book indexing this record's birthday and the key it is stored under
+        self._book: "AddressBook | None" = None
+        self._key: str | None = None
         self.name = Name(name)
-        self.phones = []
-        self.birthday = None
+        # Phone numbers as an insertion-ordered set
+        self.phones: dict[str, None] = {}
+        self._birthday: Birthday | None = None
+        self._cached_str: str | None = None
+
+    @property
+    def birthday(self) -> Birthday | None:
+        return self._birthday
+
+    # Setting a birthday keeps the owning book's index in step
+    @birthday.setter
+    def birthday(self, birthday: Birthday | None):
+        if self._book is not None:
+            self._book._unindex_birthday(self._key, self)
+        self._birthday = birthday
+        self._cached_str = None
+        if self._book is not None:
+            self._book._index_birthday(self._key, self)
 
     # Method to find a phone number
-    def find_phone(self, phone: str) -> Phone | None:
-        for ph in self.phones:
-            if phone == ph.value:
-                return ph
-        return None
+    def find_phone(self, phone: str) -> str | None:
+        return phone if phone in self.phones else None
     
     # Method to add a new phone number
     def add_phone(self, phone: str):
-        phone = Phone(phone)
-        if phone.value not in [ph.value for ph in self.phones]:
-            self.phones.append(phone)
+        self.phones.setdefault(_validate_phone(phone))
+        self._cached_str = None
     
     # Method to remove a phone number
     def remove_phone(self, phone: str):
-        self.phones = [ph for ph in self.phones if ph.value != phone]
+        self.phones.pop(phone, None)
+        self._cached_str = None
     
     # Method to edit an existing phone number
     def edit_phone(self, old_phone: str, new_phone: str):
-        if self.find_phone(old_phone):
-            self.add_phone(new_phone)
-            self.remove_phone(old_phone)
+        if old_phone in self.phones:
+            new_phone = _validate_phone(new_phone)
+            self.phones.pop(old_phone)
+            self.phones.setdefault(new_phone)
+            self._cached_str = None
         else:
             raise MissingPhoneError("Phone number to be edited is missing from the list")
     
     # Method to add birthday
     def add_birthday(self, birthday: str):
         self.birthday = Birthday(birthday)
+
+    # Pickle only name, phone numbers and birthday as plain strings
+    def __reduce__(self):
+        birthday = self.birthday.value if self.birthday else None
+        return Record, (self.name.value,), (tuple(self.phones), birthday)
+
+    def __setstate__(self, state: tuple[tuple[str, ...], str | None] | dict):
+        # Records pickled with an instance __dict__ hold Field objects
+        if isinstance(state, dict):
+            Record.__init__(self, state["name"].value)
+            phones = [getattr(phone, "value", phone) for phone in state["phones"]]
+            birthday = state["birthday"].value if state["birthday"] else None
+        else:
+            phones, birthday = state
+        for phone in phones:
+            self.add_phone(phone)
+        if birthday:
+            self.add_birthday(birthday)
         
+    # Rendered string is cached until the record changes
     def __str__(self):
-        return f"Contact name: {self.name.value}; phone(s): {', '.join(p.value for p in self.phones)}{f"; birthday: {self.birthday}" if self.birthday else ""}"
-
-class AddressBook(UserDict):
+        if self._cached_str is None:
+            text = f"Contact name: {self.name.value}; phone(s): {', '.join(self.phones)}"
+            if self.birthday:
+                text += f"; birthday: {self.birthday.value}"
+            self._cached_str = text
+        return self._cached_str
+
+# Function to find the next given weekday after a date
+@lru_cache(maxsize=512)
+def find_next_weekday(start_date: date, weekday: int) -> date:
+    days_ahead = weekday - start_date.weekday()
+    if days_ahead <= 0:
+        days_ahead += 7
+    return start_date + timedelta(days=days_ahead)
+
+# Function to move a weekend date to the following Monday
+@lru_cache(maxsize=512)
+def adjust_for_weekend(birthday: date) -> date:
+    if birthday.weekday() >= 5:
+        return find_next_weekday(birthday, 0)
+    return birthday
+
+class AddressBook(dict):
+    def __init__(self, *args, **kwargs):
+        # Birthdays sorted by (month, day) for upcoming birthdays lookup
+        self._by_md: list[tuple[tuple[int, int], str]] = []
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    # All writes go through __setitem__/__delitem__ to keep the index in step.
+    # A record belongs to one book under one key, anywhere else gets a copy
+    def __setitem__(self, name: str, record: Record):
+        if record._book is not None and (record._book is not self or record._key != name):
+            record = copy.copy(record)
+        old_record = self.get(name)
+        if old_record is not None:
+            self._detach(name, old_record)
+        super().__setitem__(name, record)
+        record._book, record._key = self, name
+        self._index_birthday(name, record)
+
+    def __delitem__(self, name: str):
+        record = self[name]
+        super().__delitem__(name)
+        self._detach(name, record)
+
+    def pop(self, name: str, *default):
+        if name in self:
+            record = self[name]
+            del self[name]
+            return record
+        return super().pop(name, *default)
+
+    def popitem(self) -> tuple[str, Record]:
+        name, record = super().popitem()
+        self._detach(name, record)
+        return name, record
+
+    def clear(self):
+        for record in self.values():
+            if record._book is self:
+                record._book = record._key = None
+        super().clear()
+        self._by_md.clear()
+
+    def update(self, *args, **kwargs):
+        for name, record in dict(*args, **kwargs).items():
+            self[name] = record
+
+    def setdefault(self, name: str, record: Record) -> Record:
+        if name not in self:
+            self[name] = record
+        return self[name]
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    # Copies and unions are address books with their own records and index
+    def copy(self) -> "AddressBook":
+        return type(self)(self)
+
+    __copy__ = copy
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        book = self.copy()
+        book.update(other)
+        return book
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        book = type(self)(other)
+        book.update(self)
+        return book
+
+    # Method to add a birthday entry to the index
+    def _index_birthday(self, name: str, record: Record):
+        if record.birthday:
+            birthday = record.birthday.date
+            insort(self._by_md, ((birthday.month, birthday.day), name))
+
+    # Method to remove a birthday entry from the index
+    def _unindex_birthday(self, name: str, record: Record):
+        if record.birthday:
+            birthday = record.birthday.date
+            entry = ((birthday.month, birthday.day), name)
+            i = bisect_left(self._by_md, entry)
+            if i < len(self._by_md) and self._by_md[i] == entry:
+                self._by_md.pop(i)
 
     # Method to add a record
     def add_record(self, record: Record):
-        self.data[record.name.value] = record
+        self[record.name.value] = record
+
+    # Method to drop a record from the index and forget this book
+    def _detach(self, name: str, record: Record):
+        self._unindex_birthday(name, record)
+        if record._book is self:
+            record._book = record._key = None
+
+    # Method to add birthday to an existing record
+    def add_birthday(self, name: str, birthday: str):
+        self[name].add_birthday(birthday)
 
     # Method to find a record
-    def find(self, name: str) -> Phone | None:
-        if name in self.data:
-            return self.data[name]
-        return None
+    def find(self, name: str) -> Record | None:
+        return self.get(name)
     
     # Method to delete an existing record
     def delete(self, name: str):
-        if name in self.data:
-            self.data.pop(name)
+        self.pop(name, None)
 
-    @staticmethod
-    def date_to_string(date: datetime) -> str:
-        return date.strftime("%d.%m.%Y")
+    # Pickle names and records only, the birthday index is rebuilt on load
+    def __reduce__(self):
+        return type(self), (), tuple(self.items())
 
-    @staticmethod
-    def find_next_weekday(start_date: datetime, weekday: datetime) -> datetime:
-        days_ahead = weekday - start_date.weekday()
-        if days_ahead <= 0:
-            days_ahead += 7
-        return start_date + timedelta(days=days_ahead)
+    def __setstate__(self, state: tuple[tuple[str, Record], ...] | dict):
+        # Books pickled as a UserDict keep their records under "data"
+        if isinstance(state, dict):
+            AddressBook.__init__(self)
+            state = state["data"].items()
+        for name, record in state:
+            self[name] = record
 
     @staticmethod
-    def adjust_for_weekend(birthday: datetime) -> datetime:
-        if birthday.weekday() >= 5:
-            return AddressBook.find_next_weekday(birthday, 0)
-        return birthday
+    def date_to_string(day: date) -> str:
+        return day.strftime("%d.%m.%Y")
 
     # Method to get upcoming birthdays
     def get_upcoming_birthdays(self):
         upcoming_birthdays = []
-        today = datetime.today()
-        for name in self.data:
-            if self.data[name].birthday:
-                birthday = datetime.strptime(self.data[name].birthday.value, "%d.%m.%Y")
-                birthday_this_year = birthday.replace(year=today.year)
-                if birthday_this_year.toordinal() < today.toordinal():
-                    birthday_this_year = birthday.replace(year=today.year+1)
-                if 0 <= (birthday_this_year.toordinal() - today.toordinal()) <= 7:
-                    birthday_this_year = AddressBook.adjust_for_weekend(birthday_this_year)
-                    congratulation_date_str = AddressBook.date_to_string(birthday_this_year)
-                    upcoming_birthdays.append({"name": name, "congratulation_date": congratulation_date_str})
+        today = date.today()
+        end = today + timedelta(days=7)
+        # Slice the index between today's and the last day's (month, day),
+        # wrapping around the year end
+        start = bisect_left(self._by_md, ((today.month, today.day), ""))
+        stop = bisect_left(self._by_md, ((end.month, end.day + 1), ""))
+        if end.year == today.year:
+            window = self._by_md[start:stop]
+        else:
+            window = self._by_md[start:] + self._by_md[:stop]
+        for (month, day), name in window:
+            year = today.year if (month, day) >= (today.month, today.day) else today.year+1
+            birthday_this_year = self[name].birthday.date.replace(year=year)
+            birthday_this_year = adjust_for_weekend(birthday_this_year)
+            congratulation_date_str = AddressBook.date_to_string(birthday_this_year)
+            upcoming_birthdays.append({"name": name, "congratulation_date": congratulation_date_str})
         return upcoming_birthdays
 
     def __str__(self):
-        return "\n".join(record.__str__() for record in self.data.values())
+        return "\n".join(record.__str__() for record in self.values())
 
 # Decorator to handle input errors
 def input_error(func: Callable):
@@ -145,13 +361,13 @@ def input_error(func: Callable):
         try:
             return func(*args, **kwargs)
         except ValueError:
-            return f"{Fore.RED}\nInvalid command format (name/phone missing)"
+            return f"{RED_NL}Invalid command format (name/phone missing)"
         except IndexError:
-            return f"{Fore.RED}\nEnter argument for the command please"
+            return f"{RED_NL}Enter argument for the command please"
         except (KeyError, AttributeError):
-            return f"{Fore.RED}\nContact doesn't exist"
+            return f"{RED_NL}Contact doesn't exist"
         except (PhoneValidationError, MissingPhoneError, DateValidationError) as e:
-            return f"{Fore.RED}\n{e}"
+            return f"{RED_NL}{e}"
     return inner
 
 # Function to parse user's input
@@ -166,9 +382,10 @@ def parse_input(user_input: str) -> tuple[str, list[str]]:
         tuple[str, list[str]]: a tuple with command as first element and list of arguments
             as second element
     """
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, *args
+    parts = user_input.split()
+    if not parts:
+        return ("",)
+    return parts[0].lower(), *parts[1:]
 
 # Function to add contact
 @input_error
@@ -184,13 +401,14 @@ def add_contact(args: list[str], book: AddressBook) -> str:
         str: formatted string with notification
     """
     name, phone, *_ = args
-    if book.find(name):
-        book[name].add_phone(phone)
+    record = book.get(name)
+    if record is not None:
+        record.add_phone(phone)
     else:
         record = Record(name)
         record.add_phone(phone)
         book.add_record(record)
-    return f"{Fore.GREEN}\nContact/phone added: {name} {phone}"
+    return f"{GREEN_NL}Contact/phone added: {name} {phone}"
 
 # Function to change contact
 @input_error
@@ -207,7 +425,7 @@ def change_contact(args: list[str], book: AddressBook) -> str:
     """
     name, old_phone, new_phone, *_ = args
     book.find(name).edit_phone(old_phone, new_phone)
-    return f"{Fore.GREEN}\n{name}: phone {old_phone} changed to {new_phone}"
+    return f"{GREEN_NL}{name}: phone {old_phone} changed to {new_phone}"
 
 # Function to show contact
 @input_error
@@ -223,7 +441,7 @@ def show_phone(args: list[str], book: AddressBook) -> str:
         str: formatted string with notification
     """
     name = args[0]
-    return f"{Fore.GREEN}\n{name}: {'; '.join(p.value for p in book[name].phones)}"
+    return f"{GREEN_NL}{name}: {'; '.join(book[name].phones)}"
 
 # Function to add birthday
 @input_error
@@ -239,8 +457,8 @@ def add_birthday(args: list[str], book: AddressBook) -> str:
         str: formatted string with notification
     """
     name, birthday, *_ = args
-    book.data[name].add_birthday(birthday)
-    return f"{Fore.GREEN}\nBirthday added: {name} {birthday}"
+    book.add_birthday(name, birthday)
+    return f"{GREEN_NL}Birthday added: {name} {birthday}"
 
 # Function to show birthday
 @input_error
@@ -256,11 +474,12 @@ def show_birthday(args: list[str], book: AddressBook) -> str:
         str: formatted string with notification
     """
     name = args[0]
-    if book.find(name):
-        if book[name].birthday:
-            return f"{Fore.GREEN}\n{name}: {book[name].birthday}"
-        return Fore.GREEN + f"\nThere is no birthday for {name} yet"
-    return Fore.GREEN + f"\nContact \"{name}\" doesn't exist"
+    record = book.get(name)
+    if record is None:
+        return f"{GREEN_NL}Contact \"{name}\" doesn't exist"
+    if record.birthday:
+        return f"{GREEN_NL}{name}: {record.birthday}"
+    return f"{GREEN_NL}There is no birthday for {name} yet"
 
 # Function to show congratulation dates
 @input_error
@@ -274,9 +493,10 @@ def birthdays(book: AddressBook) -> str:
     Returns:
         str: formatted string with notification
     """
-    if book.get_upcoming_birthdays():
-        return f"{Fore.GREEN}\nDon't forget to congratulate:\n\n{"\n".join(f"{item["name"]} on {item["congratulation_date"]}" for item in book.get_upcoming_birthdays())}"
-    return f"{Fore.GREEN}\nCongratulation list is empty"
+    upcoming_birthdays = book.get_upcoming_birthdays()
+    if upcoming_birthdays:
+        return f"{GREEN_NL}Don't forget to congratulate:\n\n{"\n".join(f"{item["name"]} on {item["congratulation_date"]}" for item in upcoming_birthdays)}"
+    return f"{GREEN_NL}Congratulation list is empty"
 
 # Function to show all contacts
 def show_all_contacts(book: AddressBook) -> str:
@@ -290,8 +510,8 @@ def show_all_contacts(book: AddressBook) -> str:
         str: formatted string with information/notification
     """
     if len(book) == 0:
-        return Fore.GREEN + "\nThere are no contacts yet"
-    return f"\n{Fore.GREEN}{book}"
+        return f"{GREEN_NL}There are no contacts yet"
+    return f"{GREEN_NL}{book}"
 
 # Function to save contact book to a file
 def save_data(book: AddressBook, filename="addressbook.pkl"):
@@ -305,8 +525,9 @@ def save_data(book: AddressBook, filename="addressbook.pkl"):
     Returns:
         None
     """
+    import pickle
     with open(filename, "wb") as f:
-        pickle.dump(book, f)
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 # Function to load contact book from a file
 def load_data(filename="addressbook.pkl") -> AddressBook:
@@ -319,6 +540,7 @@ def load_data(filename="addressbook.pkl") -> AddressBook:
     Returns:
         book (AddressBook): existing contacts
     """
+    import pickle
     try:
         with open(filename, "rb") as f:
             return pickle.load(f)
@@ -330,75 +552,38 @@ def main():
     """
     Handles phone bot operations
     """
-    colours = (Fore.RED, Fore.GREEN, Fore.YELLOW, Fore.BLUE, Fore.MAGENTA, Fore.CYAN, Fore.WHITE)
-    bot_banner = f"""{choice(colours)}\
- ██▓███   ██░ ██  ▒█████   ███▄    █ ▓█████     ▄▄▄▄    ▒█████  ▄▄▄█████▓
-▓██░  ██▒▓██░ ██▒▒██▒  ██▒ ██ ▀█   █ ▓█   ▀    ▓█████▄ ▒██▒  ██▒▓  ██▒ ▓▒
-▓██░ ██▓▒▒██▀▀██░▒██░  ██▒▓██  ▀█ ██▒▒███      ▒██▒ ▄██▒██░  ██▒▒ ▓██░ ▒░
-▒██▄█▓▒ ▒░▓█ ░██ ▒██   ██░▓██▒  ▐▌██▒▒▓█  ▄    ▒██░ █▀  ▒██   ██░░ ▓██▓ ░ 
-▒██▒ ░  ░░▓█▒░██▓░ ████▓▒░▒██░   ▓██░░▒████▒   ░▓█  ▀█▓░ ████▓▒░  ▒██▒ ░ 
-▒▓▒░ ░  ░ ▒ ░░▒░▒░ ▒░▒░▒░ ░ ▒░   ▒ ▒ ░░ ▒░ ░   ░▒▓███▀▒░ ▒░▒░▒░   ▒ ░░   
-░▒ ░      ▒ ░▒░ ░  ░ ▒ ▒░ ░ ░░   ░ ▒░ ░ ░  ░   ▒░▒   ░   ░ ▒ ▒░     ░    
-░░        ░  ░░ ░░ ░ ░ ▒     ░   ░ ░    ░       ░    ░ ░ ░ ░ ▒    ░      
-          ░  ░  ░    ░ ░           ░    ░  ░    ░          ░ ░           
-                                                     ░                   """
-    print(bot_banner + "\n")
-    print(Fore.GREEN + "Welcome to the assistant bot!".upper())
-    command_list = f"""
-    {Fore.BLUE + "List of available commands".upper()}:
-
-    {Fore.WHITE}hello {Fore.BLUE}- say hello to the bot
-    {Fore.WHITE}help {Fore.BLUE}- show list of commands
-    {Fore.WHITE}add <username> <phone> {Fore.BLUE}- add a new contact with phone number
-    {Fore.WHITE}change <username> <old phone> <new phone>{Fore.BLUE}- change phone number
-    {Fore.WHITE}phone <username> {Fore.BLUE}- show phone number
-    {Fore.WHITE}add-birthday <username> <birthday (dd.mm.YYYY)>{Fore.BLUE}- add/change birthday
-    {Fore.WHITE}show-birthday <username> {Fore.BLUE}- show birthday
-    {Fore.WHITE}birthdays {Fore.BLUE}- show all congratulation dates within the next 7 days
-    {Fore.WHITE}all {Fore.BLUE}- show all contacts
-    {Fore.WHITE}exit {Fore.BLUE}- exit the bot
-    {Fore.WHITE}close {Fore.BLUE}- exit the bot
-    """
-    print(command_list, end="")
+    print(choice(COLOURS) + BOT_BANNER + "\n")
+    print(WELCOME)
+    print(COMMAND_LIST, end="")
+    # Command handlers taking arguments and contacts
+    dispatch = {
+        "hello": lambda args, book: f"{WHITE_NL}How can I help you?",
+        "help": lambda args, book: COMMAND_LIST.rstrip(),
+        "add": add_contact,
+        "change": change_contact,
+        "phone": show_phone,
+        "add-birthday": add_birthday,
+        "show-birthday": show_birthday,
+        "birthdays": lambda args, book: birthdays(book),
+        "all": lambda args, book: show_all_contacts(book),
+    }
     book = load_data()
     while True:
-        user_input = input(Fore.YELLOW + "\nEnter a command: " + Fore.WHITE)
+        # input() flushes the buffered response before showing the prompt
+        user_input = input(PROMPT)
         command, *args = parse_input(user_input)
+        handler = dispatch.get(command)
+        if handler:
+            result = handler(args, book)
         # 'Exit' or 'close' commands
-        if command in ("exit", "close"):
+        elif command in ("exit", "close"):
             save_data(book)
-            print(Fore.GREEN + "\nGoodbye!".upper())
+            sys.stdout.write(f"{GREEN_NL}GOODBYE!\n")
             break
-        # 'Hello' command
-        if command == "hello":
-            print(Fore.WHITE + "\nHow can I help you?")
-        # 'Help' command
-        elif command == "help":
-            print(command_list, end="")
-        # 'Add' command
-        elif command == "add":
-            print(add_contact(args, book))
-        # 'Change' command
-        elif command == "change":
-            print(change_contact(args, book))
-        # 'Phone' command
-        elif command == "phone":
-            print(show_phone(args, book))
-        # 'add-birthday' command
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-        # 'show-birthday' command
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-        # 'birthdays' command
-        elif command == "birthdays":
-            print(birthdays(book))
-        # 'All' command
-        elif command == "all":
-            print(show_all_contacts(book))
         # Command absent from command list
         else:
-            print(Fore.RED + "\nInvalid command")
+            result = f"{RED_NL}Invalid command"
+        sys.stdout.write(result + "\n")
     print(Fore.RESET, end="")
 
 if __name__ == "__main__":